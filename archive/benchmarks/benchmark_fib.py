@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import argparse
-import time
-from statistics import mean
+import timeit
 
 from python_mastery_portfolio.algorithms import fibonacci
 
@@ -10,22 +9,26 @@ from python_mastery_portfolio.algorithms import fibonacci
 def run(iterations: int = 1000, n: int = 20, warmup: int = 5) -> dict[str, float]:
     """Run a simple benchmark for `fibonacci(n)`.
 
-    Returns a dict with total elapsed milliseconds and average milliseconds
-    per invocation.
+    Calls are batched with :class:`timeit.Timer` so that timer overhead is not
+    attributed to ``fibonacci``. Batches are whole, so the number of timed
+    calls is ``iterations`` rounded down to a multiple of the batch size; the
+    reported ``iterations`` is that actual count. ``total_ms`` is the time spent
+    across all timed batches and ``avg_ms`` is the per-call time of the fastest
+    batch.
     """
     # Warmup
     for _ in range(warmup):
         fibonacci(n)
 
-    timings: list[float] = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        fibonacci(n)
-        timings.append((time.perf_counter() - start) * 1000)
+    timer = timeit.Timer(lambda: fibonacci(n))
+    number, _ = timer.autorange()
+    number = max(1, min(number, iterations))
+    repeat = max(1, iterations // number)
+    times = timer.repeat(repeat=repeat, number=number)
 
-    total_ms = sum(timings)
-    avg_ms = mean(timings) if timings else 0.0
-    return {"iterations": iterations, "n": n, "total_ms": total_ms, "avg_ms": avg_ms}
+    total_ms = sum(times) * 1000
+    avg_ms = min(times) / number * 1000
+    return {"iterations": number * repeat, "n": n, "total_ms": total_ms, "avg_ms": avg_ms}
 
 
 def main() -> None:
@@ -1,3 +1,9 @@
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import streamlit as st
 
 st.set_page_config(page_title="PM Portfolio Demo", layout="wide")
@@ -18,31 +24,68 @@ if use_testclient:
     client = TestClient(app)
 else:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    @st.cache_resource
+    def _http_session() -> requests.Session:
+        """Return a pooled session shared across reruns (keep-alive, retries on 5xx)."""
+        session = requests.Session()
+        session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    session = _http_session()
+
+
+def _get(path: str, params: dict[str, int] | None = None) -> Any:
+    if use_testclient:
+        return client.get(path, params=params)
+    return session.get(f"{api_url}{path}", params=params, timeout=10)
+
 
+@st.cache_data(show_spinner=False)
+def _get_json(target: str, path: str, params: tuple[tuple[str, int], ...] = ()) -> Any:
+    """GET ``path`` and memoize the JSON body per target; fib/gcd results are pure."""
+    return _get(path, params=dict(params) or None).json()
+
+
+api_target = api_mode if use_testclient else api_url
 
 # Simple API examples
 st.header("API Examples")
-col1, col2 = st.columns(2)
-with col1:
-    n = st.number_input("Fibonacci n", min_value=0, value=20, step=1)
-    if st.button("Get Fibonacci"):
-        if use_testclient:
-            r = client.get(f"/fib/{n}")
-            st.json(r.json())
-        else:
-            r = requests.get(f"{api_url}/fib/{n}")
-            st.json(r.json())
-
-with col2:
-    a = st.number_input("GCD a", value=48, step=1)
-    b = st.number_input("GCD b", value=18, step=1)
-    if st.button("Compute GCD"):
-        if use_testclient:
-            r = client.get("/math/gcd", params={"a": a, "b": b})
-            st.json(r.json())
-        else:
-            r = requests.get(f"{api_url}/math/gcd", params={"a": a, "b": b})
-            st.json(r.json())
+# Inputs live in a form so editing them does not rerun the script until submit.
+with st.form("api_examples"):
+    col1, col2 = st.columns(2)
+    with col1:
+        n = st.number_input("Fibonacci n", min_value=0, value=20, step=1)
+        fib_submitted = st.form_submit_button("Get Fibonacci")
+    with col2:
+        a = st.number_input("GCD a", value=48, step=1)
+        b = st.number_input("GCD b", value=18, step=1)
+        gcd_submitted = st.form_submit_button("Compute GCD")
+    both_submitted = st.form_submit_button("Run both")
+
+fib_path = f"/fib/{int(n)}"
+gcd_params = (("a", int(a)), ("b", int(b)))
+out1, out2 = st.columns(2)
+if both_submitted:
+    # The two calls are independent: overlap them so the wait is max(t1, t2), not t1 + t2.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fib_future = ex.submit(_get_json, api_target, fib_path)
+        gcd_future = ex.submit(_get_json, api_target, "/math/gcd", gcd_params)
+    out1.json(fib_future.result())
+    out2.json(gcd_future.result())
+elif fib_submitted:
+    out1.json(_get_json(api_target, fib_path))
+elif gcd_submitted:
+    out2.json(_get_json(api_target, "/math/gcd", gcd_params))
 
 # Embeddings demo
 st.header("Embeddings / Semantic Search Demo")
@@ -54,50 +97,203 @@ default_docs = [
     "Sentence Transformers allows easy computation of dense vector representations for sentences.",
 ]
 
-docs_text = st.text_area("Documents (one per line)", value="\n".join(default_docs), height=200)
-query = st.text_input("Query", value="How to build an API in Python?")
 
-docs: list[str] = [d.strip() for d in docs_text.splitlines() if d.strip()]
 
-use_transformers = st.checkbox("Prefer sentence-transformers if available", value=True)
+# Encoder backends: (sentence-transformers backend, optional model file). The int8 file is
+# the dynamically quantized ONNX export published alongside all-MiniLM-L6-v2.
+_ST_BACKENDS: dict[str, tuple[str, str | None]] = {
+    "torch": ("torch", None),
+    "onnx": ("onnx", None),
+    "onnx (int8)": ("onnx", "onnx/model_quint8_avx2.onnx"),
+}
+
+
+@st.cache_resource
+def _get_st_model(name: str, backend: str = "torch") -> Any:
+    """Load a SentenceTransformer once per process instead of on every search.
+
+    The ONNX backends need ``pip install "sentence-transformers[onnx]>=3.2"``; the
+    ``backend`` keyword is only passed for them, so torch works on any 3.x release.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    st_backend, file_name = _ST_BACKENDS[backend]
+    if st_backend == "torch":
+        return SentenceTransformer(name)
+    if file_name is None:
+        return SentenceTransformer(name, backend=st_backend)
+    return SentenceTransformer(name, backend=st_backend, model_kwargs={"file_name": file_name})
+
+
+class _EmbeddingLRU:
+    """Embeddings keyed by a content hash, evicted least-recently-used.
+
+    Only texts that are not cached yet are passed to ``model.encode``, sorted by
+    length so each batch pads to a similar size. Vectors are stored L2-normalized
+    as float32, so cosine similarity is a plain dot product.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, model: Any, texts: list[str]) -> Any:
+        import numpy as np
+
+        keys = [hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest() for t in texts]
+        with self._lock:
+            missing = {k: t for k, t in zip(keys, texts, strict=True) if k not in self._data}
+        pending = sorted(missing.items(), key=lambda kv: len(kv[1]))
+        vecs = (
+            model.encode(
+                [t for _, t in pending],
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            ).astype(np.float32, copy=False)
+            if pending
+            else []
+        )
+        with self._lock:
+            self._data.update(
+                (k, np.ascontiguousarray(v, dtype=np.float32))
+                for (k, _), v in zip(pending, vecs, strict=True)
+            )
+            # np.stack yields a fresh C-contiguous float32 matrix for BLAS to scan.
+            out = np.stack([self._data[k] for k in keys])
+            for k in keys:
+                self._data.move_to_end(k)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return out
+
+
+@st.cache_resource
+def _embedding_cache(model_name: str, maxsize: int) -> _EmbeddingLRU:
+    return _EmbeddingLRU(maxsize)
+
+
+class _QueryCache:
+    """Recent ``(query embedding, ranking, scores)`` entries for one model and doc set.
+
+    A new query whose cosine similarity to a cached query reaches the threshold
+    reuses that ranking, skipping the scoring and sort for near-duplicate queries.
+    """
+
+    def __init__(self, maxlen: int = 128) -> None:
+        self._entries: deque[tuple[Any, Any, Any]] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def lookup(self, q_emb: Any, threshold: float) -> tuple[Any, Any] | None:
+        import numpy as np
+
+        with self._lock:
+            if not self._entries:
+                return None
+            hits = np.stack([e[0] for e in self._entries]).dot(q_emb)
+            best = int(hits.argmax())
+            if hits[best] < threshold:
+                return None
+            _, ranked, sims = self._entries[best]
+            return ranked, sims
+
+    def add(self, q_emb: Any, ranked: Any, sims: Any) -> None:
+        with self._lock:
+            self._entries.append((q_emb, ranked, sims))
+
+
+@st.cache_resource(max_entries=32)
+def _query_cache(model_key: str, docs: tuple[str, ...]) -> _QueryCache:
+    return _QueryCache()
+
+
+@st.cache_resource
+def _hashing_vectorizer() -> Any:
+    """Stateless term-hashing vectorizer: nothing to fit, rows come out L2-normalized."""
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(n_features=2**18, alternate_sign=False, norm="l2")
 
-if st.button("Run semantic search"):
+
+@st.cache_data(show_spinner=False)
+def _parse_docs(text: str) -> list[str]:
+    """Split the text area into stripped, non-empty documents (memoized per text)."""
+    return [d.strip() for d in text.splitlines() if d.strip()]
+
+
+@st.cache_data(show_spinner=False)
+def _doc_labels(text: str) -> list[str]:
+    """Truncated chart labels for each document in ``text``."""
+    return [d[:80] + ("..." if len(d) > 80 else "") for d in _parse_docs(text)]
+
+
+def _top_k(sims: Any, k: int = 20) -> Any:
+    """Return indices of the ``k`` highest scores, best first."""
+    import numpy as np
+
+    if len(sims) <= 32:
+        return np.argsort(-sims)[:k]
+    k = min(k, len(sims))
+    top = np.argpartition(-sims, k - 1)[:k]
+    return top[np.argsort(-sims[top])]
+
+
+with st.form("semantic_search"):
+    docs_text = st.text_area(
+        "Documents (one per line)", value="\n".join(default_docs), height=200
+    )
+    query = st.text_input("Query", value="How to build an API in Python?")
+    use_transformers = st.checkbox("Prefer sentence-transformers if available", value=True)
+    encoder_backend = st.selectbox("Encoder backend", list(_ST_BACKENDS))
+    cache_threshold = st.slider(
+        "Semantic cache threshold (cosine)", min_value=0.80, max_value=1.0, value=0.95, step=0.01
+    )
+    search_submitted = st.form_submit_button("Run semantic search")
+
+docs = _parse_docs(docs_text)
+
+if search_submitted:
     try:
         if use_transformers:
             import numpy as np
-            from sentence_transformers import SentenceTransformer
-
-            model = SentenceTransformer("all-MiniLM-L6-v2")
-            doc_emb = model.encode(docs, convert_to_numpy=True)
-            q_emb = model.encode([query], convert_to_numpy=True)[0]
-            sims = (doc_emb @ q_emb) / (
-                np.linalg.norm(doc_emb, axis=1) * np.linalg.norm(q_emb) + 1e-12
-            )
-            ranked = sims.argsort()[::-1]
-            st.write("Using dense sentence-transformers embeddings")
-            for i in ranked:
-                st.write(f"score={sims[i]:.4f}  {docs[i]}")
 
+            model_name = "all-MiniLM-L6-v2"
+            model = _get_st_model(model_name, encoder_backend)
+            # One encode call covers any uncached docs and the query together.
+            cache = _embedding_cache(f"{model_name}:{encoder_backend}", 4096)
+            all_emb = cache.encode(model, [*docs, query])
+            doc_emb, q_emb = all_emb[:-1], all_emb[-1]
+            qcache = _query_cache(f"{model_name}:{encoder_backend}", tuple(docs))
+            hit = qcache.lookup(q_emb, cache_threshold)
+            if hit is None:
+                sims = doc_emb.dot(q_emb)  # contiguous float32 rows -> single sgemv
+                ranked = _top_k(sims)
+                qcache.add(q_emb, ranked, sims)
+            else:
+                ranked, sims = hit
+                st.caption("Served from the semantic query cache")
+            st.write(f"Using dense sentence-transformers embeddings ({encoder_backend})")
         else:
-            raise ImportError("force TF-IDF")
+            raise ImportError("force sparse fallback")
     except Exception:
-        st.write("Falling back to TF-IDF")
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
+        st.write("Falling back to hashed term vectors")
+        vect = _hashing_vectorizer().transform([*docs, query])
+        # Rows are already unit length, so the sparse dot product is the cosine.
+        sims = (vect[:-1] @ vect[-1].T).toarray().ravel()
+        ranked = _top_k(sims)
 
-        vect = TfidfVectorizer().fit_transform(docs + [query])
-        sims = cosine_similarity(vect[-1], vect[:-1])[0]
-        ranked = sims.argsort()[::-1]
-        for i in ranked:
-            st.write(f"score={sims[i]:.4f}  {docs[i]}")
+    # One markdown element for the whole list instead of one delta per result.
+    st.markdown("\n".join(f"- **{sims[i]:.4f}** — {docs[i]}" for i in ranked))
 
     # Simple bar chart
     try:
+        import numpy as np
         import pandas as pd
 
-        scores = [float(sims[i]) for i in ranked]
-        labels = [docs[i][:80] + ("..." if len(docs[i]) > 80 else "") for i in ranked]
-        df = pd.DataFrame({"score": scores}, index=labels)
+        labels = np.asarray(_doc_labels(docs_text), dtype=object)[ranked]
+        df = pd.DataFrame({"score": np.asarray(sims)[ranked]}, index=labels)
         st.bar_chart(df)
     except Exception:
         pass
@@ -1,34 +1,87 @@
-"""Public package exports."""
+"""Public package exports.
+
+Submodules are imported lazily (PEP 562): ``import python_mastery_portfolio``
+only loads this file, and each exported name pulls in its module on first
+attribute access.
+"""
 
 # Updated 2026-03-09
 
+from importlib import import_module as _import_module
 from importlib import metadata as _metadata
-
-from .algorithms import binary_search, fibonacci
-from .caching import LRUCache, async_cache, cache
-from .decorators import CachedProperty, async_retry, retry, timed, validate_types
-from .di_container import DIContainer, LifecycleScope, get_container
-from .exceptions import (
-    APIError,
-    ConfigurationError,
-    DataProcessingError,
-    PortfolioError,
-    RateLimitError,
-    ValidationError,
-)
-from .typing_utils import Container, Pipeline, Result
-from .utils import timeit
-from .vin import compute_check_digit, is_valid_vin
+from typing import TYPE_CHECKING, Any
 
 try:
     __version__ = _metadata.version("python-mastery-portfolio")
 except Exception:
     __version__ = "0.0.0"
 
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, so type checkers see real types.
+    from .algorithms import binary_search, fibonacci
+    from .caching import LRUCache, ShardedLRUCache, async_cache, cache
+    from .decorators import CachedProperty, async_retry, retry, timed, validate_types
+    from .di_container import DIContainer, LifecycleScope, get_container
+    from .exceptions import (
+        APIError,
+        ConfigurationError,
+        DataProcessingError,
+        PortfolioError,
+        RateLimitError,
+        ValidationError,
+    )
+    from .typing_utils import Container, Pipeline, Result
+    from .utils import timeit
+    from .vin import compute_check_digit, is_valid_vin
+
+# Exported name -> submodule that defines it.
+_LAZY = {
+    "fibonacci": ".algorithms",
+    "binary_search": ".algorithms",
+    "LRUCache": ".caching",
+    "ShardedLRUCache": ".caching",
+    "async_cache": ".caching",
+    "cache": ".caching",
+    "CachedProperty": ".decorators",
+    "async_retry": ".decorators",
+    "retry": ".decorators",
+    "timed": ".decorators",
+    "validate_types": ".decorators",
+    "DIContainer": ".di_container",
+    "LifecycleScope": ".di_container",
+    "get_container": ".di_container",
+    "APIError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "DataProcessingError": ".exceptions",
+    "PortfolioError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "Container": ".typing_utils",
+    "Pipeline": ".typing_utils",
+    "Result": ".typing_utils",
+    "timeit": ".utils",
+    "compute_check_digit": ".vin",
+    "is_valid_vin": ".vin",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module, __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Core patterns
     "retry", "async_retry", "timed", "validate_types", "CachedProperty",
-    "LRUCache", "cache", "async_cache",
+    "LRUCache", "ShardedLRUCache", "cache", "async_cache",
     "DIContainer", "LifecycleScope", "get_container",
     "PortfolioError", "ValidationError", "RateLimitError", "ConfigurationError", "DataProcessingError", "APIError",
     "Container", "Pipeline", "Result",
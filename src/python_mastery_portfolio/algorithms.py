@@ -7,12 +7,47 @@ simple and intended for educational/demo use.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Sequence
+from math import gcd as _math_gcd
+from typing import Any
+
+try:
+    from gmpy2 import mpz as _mpz  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    _mpz = None
+
+
+# Below this index the plain loop beats fast doubling's constant factor.
+_FIB_ITERATIVE_MAX = 64
+# Above this index GMP's multiplication outweighs the int <-> mpz conversions.
+_FIB_GMPY2_MIN = 20_000
 
 
 def fibonacci(n: int) -> int:
     """Return the n-th Fibonacci number (0-indexed).
 
+    Small ``n`` use the iterative loop; larger ``n`` use fast doubling.
+
+    Args:
+        n: Non-negative index of the Fibonacci sequence.
+
+    Returns:
+        The n-th Fibonacci integer.
+
+    Raises:
+        ValueError: if ``n`` is negative.
+    """
+    if n < _FIB_ITERATIVE_MAX:
+        return fibonacci_iterative(n)
+    return fibonacci_fast(n)
+
+
+def fibonacci_iterative(n: int) -> int:
+    """Return the n-th Fibonacci number using a linear loop.
+
+    Reference implementation with O(n) big-int additions.
+
     Args:
         n: Non-negative index of the Fibonacci sequence.
 
@@ -33,27 +68,30 @@ def fibonacci(n: int) -> int:
 def binary_search(seq: Sequence[int], value: int) -> int:
     """Perform binary search on a sorted sequence.
 
+    The search itself runs in C via :func:`bisect.bisect_left`. Array types that
+    provide ``searchsorted`` (e.g. ``numpy.ndarray``) use that instead, which
+    avoids boxing an element for every probe.
+
     Args:
         seq: Sequence of integers (must be sorted in ascending order).
         value: Value to search for.
 
     Returns:
-        Index of ``value`` in ``seq`` if found, otherwise ``-1``.
+        Index of the first occurrence of ``value`` in ``seq`` if found,
+        otherwise ``-1``.
     """
-    lo, hi = 0, len(seq) - 1
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        if seq[mid] == value:
-            return mid
-        if seq[mid] < value:
-            lo = mid + 1
-        else:
-            hi = mid - 1
+    searchsorted = getattr(seq, "searchsorted", None)
+    i = int(searchsorted(value)) if searchsorted is not None else bisect_left(seq, value)
+    if i < len(seq) and seq[i] == value:
+        return i
     return -1
 
 
 def gcd(a: int, b: int) -> int:
-    """Compute the greatest common divisor using Euclid's algorithm.
+    """Compute the greatest common divisor of two integers.
+
+    Delegates to :func:`math.gcd`, which runs Euclid's algorithm in C (with
+    Lehmer's acceleration for large integers).
 
     Args:
         a: First integer.
@@ -65,19 +103,18 @@ def gcd(a: int, b: int) -> int:
     Raises:
         ValueError: if both ``a`` and ``b`` are zero (gcd undefined).
     """
-    a, b = int(a), int(b)
-    a, b = abs(a), abs(b)
+    a, b = abs(int(a)), abs(int(b))
     if a == 0 and b == 0:
         raise ValueError("gcd(0, 0) is undefined")
-    while b:
-        a, b = b, a % b
-    return a
+    return _math_gcd(a, b)
 
 
 def fibonacci_fast(n: int) -> int:
     """Return the n-th Fibonacci number using the fast-doubling method.
 
     This implementation runs in O(log n) time and avoids linear iteration.
+    For very large ``n`` the multiplications run on ``gmpy2.mpz`` when gmpy2
+    is installed.
 
     Args:
         n: Non-negative index of the Fibonacci sequence.
@@ -90,15 +127,24 @@ def fibonacci_fast(n: int) -> int:
     """
     if n < 0:
         raise ValueError("n must be >= 0")
+    if _mpz is not None and n > _FIB_GMPY2_MIN:
+        return int(_fib_pair(n, _mpz(0), _mpz(1))[0])
+    fib_n: int = _fib_pair(n)[0]
+    return fib_n
+
+
+def _fib_pair(k: int, a: Any = 0, b: Any = 1) -> tuple[Any, Any]:
+    """Return ``(F(k), F(k + 1))`` using the fast-doubling identities.
 
-    def _fd(k: int) -> tuple[int, int]:
-        if k == 0:
-            return 0, 1
-        a, b = _fd(k // 2)
+    Walks the bits of ``k`` from most to least significant, so there is no
+    recursion depth limit and no per-bit frame overhead. ``a`` and ``b`` seed
+    ``F(0)`` and ``F(1)``; passing ``mpz`` values keeps the arithmetic in GMP.
+    """
+    for bit in bin(k)[2:]:
         c = a * ((b << 1) - a)
         d = a * a + b * b
-        if k & 1:
-            return d, c + d
-        return c, d
-
-    return _fd(n)[0]
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
@@ -2,35 +2,47 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import io
 import json
 import logging
-from collections import defaultdict, deque
+import os
+import random
+import time
+from collections import defaultdict
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from time import monotonic
 from typing import Any
-from uuid import uuid4
 
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 
 from .algorithms import fibonacci, gcd
 from .doc_qa import QADocument, QAService
-from .excel_tools import write_rows_to_excel
+from .excel_tools import write_rows_to_excel_stream
 from .logging_utils import setup_json_logging
 from .ml_pipeline import TrainedModel, train_linear_regression
 from .ml_pipeline import predict as ml_predict
 from .monitor import PING_HISTOGRAM, PingResult, ping_url
 from .system_metrics import metrics_broadcaster
+from .vin import VinDecoded, decode_vin, generate_vin, is_valid_vin, normalize_vin
 from .websocket_manager import ConnectionManager
 
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST as _PROM_CONTENT_TYPE
+    from prometheus_client import generate_latest as _prom_generate_latest
+except Exception:  # pragma: no cover - optional
+    _PROM_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    _prom_generate_latest = None  # type: ignore
+
 from . import __version__ as __version__
 
-setup_json_logging()
+setup_json_logging(background=True)
 logger = logging.getLogger(__name__)
 
 # Record application start time for uptime reporting
@@ -42,7 +54,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage startup/shutdown tasks."""
     asyncio.create_task(metrics_broadcaster(_ws_manager, interval=2.0))
     logger.info("metrics_broadcaster_started")
+    gc_task = asyncio.create_task(_rate_bucket_gc())
     yield
+    gc_task.cancel()
 
 
 app = FastAPI(title="Python Mastery API", description="Examples: Fibonacci, VIN, ML, RAG.", lifespan=lifespan)
@@ -70,22 +84,53 @@ def _init_default_ml_model() -> None:
 _init_default_ml_model()
 
 
-_rate_buckets: dict[str, deque[float]] = defaultdict(deque)
 _RATE_LIMIT_MAX = 120
 _RATE_LIMIT_WINDOW = 60.0
 
+# ip -> (window index, hits in window, hits in previous window). Every caller is
+# an async endpoint (or the GC task) on the event loop thread, so no lock is needed.
+_rate_buckets: dict[str, tuple[int, int, int]] = {}
+
 
-def _check_rate_limit(req: Request, max_req: int = _RATE_LIMIT_MAX) -> None:
+def _check_rate_limit(req: Request, max_req: int = _RATE_LIMIT_MAX, cost: int = 1) -> None:
+    """Sliding-window counter: O(1) time and three ints of state per client.
+
+    ``cost`` is how many hits the request consumes (e.g. one per VIN in a batch);
+    it is admitted only if all of them fit.
+    """
     now = monotonic()
     ip = (req.client.host if req.client else "unknown") or "unknown"
-    dq = _rate_buckets[ip]
-    while dq and now - dq[0] > _RATE_LIMIT_WINDOW:
-        dq.popleft()
-    if len(dq) >= max_req:
-        from fastapi import HTTPException
-
+    window_f, offset = divmod(now, _RATE_LIMIT_WINDOW)
+    window = int(window_f)
+    start, current, prev = _rate_buckets.get(ip, (window, 0, 0))
+    if window != start:
+        prev = current if window == start + 1 else 0
+        current = 0
+    # The previous window counts in proportion to its overlap with the sliding window.
+    estimate = prev * (1.0 - offset / _RATE_LIMIT_WINDOW) + current
+    limited = estimate + cost - 1 >= max_req
+    _rate_buckets[ip] = (window, current if limited else current + cost, prev)
+    if limited:
         raise HTTPException(status_code=429, detail="rate limit exceeded")
-    dq.append(now)
+
+
+def _sweep_rate_buckets(now: float | None = None) -> int:
+    """Drop clients idle for two or more windows; their counts no longer matter.
+
+    Returns the number of entries removed.
+    """
+    window = int((monotonic() if now is None else now) // _RATE_LIMIT_WINDOW)
+    stale = [ip for ip, (start, _, _) in _rate_buckets.items() if start < window - 1]
+    for ip in stale:
+        del _rate_buckets[ip]
+    return len(stale)
+
+
+async def _rate_bucket_gc() -> None:
+    """Sweep idle rate-limit entries once per window so the table stays bounded."""
+    while True:
+        await asyncio.sleep(_RATE_LIMIT_WINDOW)
+        _sweep_rate_buckets()
 
 
 @dataclass
@@ -116,20 +161,29 @@ class GcdResponse:
 def fib_endpoint(n: int) -> FibResponse:
     if n < 0:
         n = 0
-    value = fibonacci(n)
+    value = _fib_cached(n) if n <= _FIB_CACHE_MAX_N else fibonacci(n)
     logger.info("fib", extra={"n": n, "value": value})
     return FibResponse(n=n, value=value)
 
 
+# Only small results are memoized: F(10_000) is ~7 kbit, so a full cache stays
+# around 1 MB, whereas caching unbounded n from the URL could pin gigabytes.
+_FIB_CACHE_MAX_N = 10_000
+
+
+@lru_cache(maxsize=1024)
+def _fib_cached(n: int) -> int:
+    """Memoized ``fibonacci`` so repeated ``/fib/{n}`` requests are a dict hit."""
+    return fibonacci(n)
+
+
 @app.get(
     "/math/gcd",
     response_model=GcdResponse,
     tags=["examples"],
     summary="Compute the greatest common divisor of two integers",
 )
-def gcd_endpoint(a: int, b: int) -> GcdResponse:
-    from fastapi import HTTPException
-
+async def gcd_endpoint(a: int, b: int) -> GcdResponse:
     try:
         value = gcd(a, b)
     except ValueError as e:
@@ -162,13 +216,38 @@ class VinResponse(BaseModel):
     tags=["examples"],
     summary="Validate a VIN using ISO 3779 (check digit)",
 )
-def vin_validate_api(req: VinRequest, request: Request) -> VinResponse:
-    from .vin import is_valid_vin
-
+async def vin_validate_api(req: VinRequest, request: Request) -> Response:
     _check_rate_limit(request)
     valid = bool(is_valid_vin(req.vin))
     logger.info("vin_validate", extra={"vin_len": len(req.vin), "valid": valid})
-    return VinResponse(vin=req.vin, valid=valid)
+    # Serialize with the model's compiled schema and skip FastAPI's response re-validation.
+    body = VinResponse(vin=req.vin, valid=valid).model_dump_json()
+    return Response(content=body, media_type="application/json")
+
+
+class VinBatchRequest(BaseModel):
+    # Each VIN is charged to the rate limit, so a batch can't exceed one window's quota.
+    vins: list[str] = Field(..., max_length=_RATE_LIMIT_MAX)
+    model_config = {
+        "json_schema_extra": {"examples": [{"vins": ["1HGCM82633A004352", "INVALIDVIN1234567"]}]}
+    }
+
+
+class VinBatchResponse(BaseModel):
+    valid: list[bool]
+
+
+@app.post(
+    "/vin/validate_batch",
+    response_model=VinBatchResponse,
+    tags=["examples"],
+    summary="Validate up to 1000 VINs in one request",
+)
+async def vin_validate_batch_api(req: VinBatchRequest, request: Request) -> VinBatchResponse:
+    _check_rate_limit(request, cost=max(1, len(req.vins)))
+    valid = [is_valid_vin(v) for v in req.vins]
+    logger.info("vin_validate_batch", extra={"count": len(valid), "valid": sum(valid)})
+    return VinBatchResponse(valid=valid)
 
 
 class VinDecodedResponse(BaseModel):
@@ -195,15 +274,12 @@ class VinDecodedResponse(BaseModel):
     tags=["examples"],
     summary="Decode structural VIN fields (WMI/VDS/VIS, year, plant, etc)",
 )
-def vin_decode_api(req: VinRequest, request: Request) -> Response:
-    from .vin import decode_vin
-
-    dec = decode_vin(req.vin)
-    logger.info("vin_decode", extra={"valid": dec.valid, "wmi": dec.wmi})
+async def vin_decode_api(req: VinRequest, request: Request) -> Response:
     _check_rate_limit(request)
-    payload = VinDecodedResponse(**dec.__dict__).model_dump()
-    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
-    etag = hashlib.md5(raw).hexdigest()  # noqa: S324 demo-only weak hash ok
+    # decode_vin normalizes anyway; keying on the normalized form lets
+    # case/spacing variants share an entry.
+    dec, raw, etag = _decode_and_hash(normalize_vin(req.vin))
+    logger.info("vin_decode", extra={"valid": dec.valid, "wmi": dec.wmi})
     inm = request.headers.get("If-None-Match")
     headers = {
         "ETag": etag,
@@ -211,7 +287,29 @@ def vin_decode_api(req: VinRequest, request: Request) -> Response:
     }
     if inm == etag:
         return Response(status_code=304, headers=headers)
-    return JSONResponse(content=payload, headers=headers)
+    return Response(content=raw, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=10_000)
+def _decode_and_hash(vin: str) -> tuple[VinDecoded, bytes, str]:
+    """Decode ``vin`` and return it with its serialized body and ETag.
+
+    ``decode_vin`` is pure, so repeated VINs skip decoding, JSON encoding and hashing.
+    """
+    dec = decode_vin(vin)
+    raw, etag = _make_etag(VinDecodedResponse(**dec.__dict__).model_dump())
+    return dec, raw, etag
+
+
+def _make_etag(payload: Any) -> tuple[bytes, str]:
+    """Serialize ``payload`` to compact JSON and return ``(body, etag)``.
+
+    The ETag is an opaque 128-bit BLAKE2b digest of the body. Keys are not sorted:
+    payloads come from ``model_dump()``, whose key order follows the model's field
+    declaration, so equal payloads already serialize to identical bytes.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return raw, hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 class VinGenerateRequest(BaseModel):
@@ -232,15 +330,11 @@ class VinGenerateResponse(BaseModel):
     tags=["examples"],
     summary="Generate a valid VIN (computes check digit)",
 )
-def vin_generate_api(req: VinGenerateRequest, request: Request) -> VinGenerateResponse:
-    from .vin import generate_vin
-
+async def vin_generate_api(req: VinGenerateRequest, request: Request) -> VinGenerateResponse:
     _check_rate_limit(request)
     try:
         vin = generate_vin(req.wmi, req.vds, req.year, req.plant_code, req.serial)
     except ValueError as e:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=400, detail=str(e)) from e
     logger.info("vin_generate", extra={"wmi": req.wmi, "year": req.year})
     return VinGenerateResponse(vin=vin)
@@ -252,7 +346,7 @@ REQUEST_COUNTERS: dict[str, int] = defaultdict(int)
 @app.middleware("http")
 async def add_timing_header(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
     start = time.perf_counter()
-    req_id = request.headers.get("X-Request-ID") or uuid4().hex
+    req_id = request.headers.get("X-Request-ID") or os.urandom(16).hex()
     # Increment simple in-memory counter for the path
     try:
         REQUEST_COUNTERS[request.url.path] += 1
@@ -273,59 +367,66 @@ async def add_timing_header(request: Request, call_next: Callable[[Request], Awa
         response.headers["X-Reproduce-Curl"] = curl_cmd
     except Exception:
         pass
-    logger.info("request", extra={"path": request.url.path, "method": request.method, "status_code": response.status_code, "ms": round(elapsed_ms, 2), "request_id": req_id})
+    # Skip building the extra dict entirely when INFO is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "request",
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "status_code": response.status_code,
+                "ms": round(elapsed_ms, 2),
+                "request_id": req_id,
+            },
+        )
     return response
 
 
 @app.get("/health")
-def health() -> dict[str, str | float]:
+async def health() -> dict[str, str | float]:
     uptime = max(0.0, monotonic() - APP_START)
     # Return status, uptime in seconds, and package version
     return {"status": "ok", "uptime": round(uptime, 3), "version": __version__}
 
 
 @app.get("/monitor/ping")
-def monitor_ping(url: str) -> PingResult:
-    return ping_url(url)
+async def monitor_ping(url: str) -> PingResult:
+    return await asyncio.to_thread(ping_url, url)
 
 
 @app.get("/metrics")
 def metrics() -> Response:
-    # Lazy import to avoid hard dependency if not installed
-    prometheus: Any | None = None
-    try:
-        import prometheus_client as prometheus  # runtime optional
-    except Exception:  # pragma: no cover - import may fail when not installed
-        prometheus = None
-        content_type_latest = "text/plain; version=0.0.4; charset=utf-8"
-    else:
-        # prometheus is a module at this point
-        content_type_latest = getattr(
-            prometheus,
-            "CONTENT_TYPE_LATEST",
-            "text/plain; version=0.0.4; charset=utf-8",
-        )
-
-    if PING_HISTOGRAM is None or prometheus is None:
+    if PING_HISTOGRAM is None or _prom_generate_latest is None:
         # Expose an empty payload to avoid 500s when optional dep is missing
-        return Response(content=b"", media_type=content_type_latest)
-    data = prometheus.generate_latest()
-    return Response(content=data, media_type=content_type_latest)
+        return Response(content=b"", media_type=_PROM_CONTENT_TYPE)
+    return Response(content=_prom_generate_latest(), media_type=_PROM_CONTENT_TYPE)
 
 
 @app.get("/stats")
-def stats() -> dict[str, object]:
+async def stats() -> dict[str, object]:
     """Return simple in-memory statistics (request counts and uptime)."""
     uptime = max(0.0, monotonic() - APP_START)
-    return {"status": "ok", "uptime": round(uptime, 3), "version": __version__, "counters": dict(REQUEST_COUNTERS)}
+    vin_cache = _decode_and_hash.cache_info()
+    return {
+        "status": "ok",
+        "uptime": round(uptime, 3),
+        "version": __version__,
+        "counters": dict(REQUEST_COUNTERS),
+        "vin_decode_cache": {
+            "hits": vin_cache.hits,
+            "misses": vin_cache.misses,
+            "size": vin_cache.currsize,
+            "maxsize": vin_cache.maxsize,
+        },
+    }
 
 
 # --- Document Q&A ---
 
 
 @app.post("/qa/documents")
-def qa_add_documents(docs: list[str]) -> dict[str, list[int]]:
-    ids = _qa.add(docs)
+async def qa_add_documents(docs: list[str]) -> dict[str, list[int]]:
+    ids = await asyncio.to_thread(_qa.add, docs)
     return {"ids": ids}
 
 
@@ -354,53 +455,55 @@ class QAIngestResponse(BaseModel):
     tags=["rag"],
     summary="Ingest structured documents (chunked) for offline RAG",
 )
-def qa_ingest(req: QAIngestRequest) -> QAIngestResponse:
+async def qa_ingest(req: QAIngestRequest) -> QAIngestResponse:
     if req.reset:
         _qa.reset()
     docs = [
         QADocument(id=d.id, text=d.text, metadata={str(k): v for k, v in d.metadata.items()})
         for d in req.documents
     ]
-    ids = _qa.add_documents(docs, chunk_size=req.chunk_size, chunk_overlap=req.chunk_overlap)
+    ids = await asyncio.to_thread(
+        _qa.add_documents, docs, chunk_size=req.chunk_size, chunk_overlap=req.chunk_overlap
+    )
     return QAIngestResponse(status="ok", ids=ids, n_chunks=len(ids))
 
 
 @app.post("/qa/search")
-def qa_search(query: str, k: int = 5) -> dict[str, object]:
-    hits = _qa.search(query, k=k)
+async def qa_search(query: str, k: int = 5) -> dict[str, object]:
+    hits = await asyncio.to_thread(_qa.search, query, k=k)
     return {"hits": hits}
 
 
 @app.post("/qa/search_rich")
-def qa_search_rich(query: str, k: int = 5) -> dict[str, object]:
-    hits = _qa.search_rich(query, k=k)
+async def qa_search_rich(query: str, k: int = 5) -> dict[str, object]:
+    hits = await asyncio.to_thread(_qa.search_rich, query, k=k)
     payload = [{"id": h.id, "score": h.score, "text": h.text, "meta": h.meta} for h in hits]
     return {"hits": payload}
 
 
 @app.post("/qa/ask")
-def qa_ask(question: str, k: int = 3) -> dict[str, object]:
-    return _qa.ask(question, k=k)
+async def qa_ask(question: str, k: int = 3) -> dict[str, object]:
+    return await asyncio.to_thread(_qa.ask, question, k=k)
 
 
 @app.post("/qa/ask_rich")
-def qa_ask_rich(question: str, k: int = 3) -> dict[str, object]:
-    return _qa.ask_rich(question, k=k)
+async def qa_ask_rich(question: str, k: int = 3) -> dict[str, object]:
+    return await asyncio.to_thread(_qa.ask_rich, question, k=k)
 
 
 @app.post("/qa/reset")
-def qa_reset() -> dict[str, str]:
+async def qa_reset() -> dict[str, str]:
     _qa.reset()
     return {"status": "reset"}
 
 
 @app.post("/qa/config")
-def qa_config(embedder: str, index: str) -> dict[str, str]:
+async def qa_config(embedder: str, index: str) -> dict[str, str]:
     try:
-        _qa.configure(embedder, index)
+        # Switching to sentence-transformers/FAISS loads a model and rebuilds the
+        # index; run it off the event loop so other requests keep flowing.
+        await asyncio.to_thread(_qa.configure, embedder, index)
     except Exception as e:  # noqa: BLE001 - return as bad request
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=400, detail=str(e)) from e
     return {"status": "ok", "embedder": embedder, "index": index}
 
@@ -426,11 +529,9 @@ class ExcelExportRequest(BaseModel):
 def excel_export_api(req: ExcelExportRequest) -> Response:
     """Return an .xlsx file generated from the provided rows.
 
-    Uses the existing utility `write_rows_to_excel`. A temporary file is created
-    and returned as an attachment.
+    Uses `write_rows_to_excel_stream` to build the workbook in memory and returns
+    it as an attachment.
     """
-    from fastapi import HTTPException
-
     # Basic validation: rows must be a non-empty list of lists of strings
     if not isinstance(req.rows, list) or len(req.rows) == 0:
         raise HTTPException(status_code=400, detail="rows must be a non-empty list")
@@ -446,13 +547,11 @@ def excel_export_api(req: ExcelExportRequest) -> Response:
             if not isinstance(cell, (str, bool, int, float)):
                 raise HTTPException(status_code=400, detail=f"cell at row {i} col {j} is not a string")
 
-    with tempfile.TemporaryDirectory() as td:
-        path = Path(td) / "export.xlsx"
-        write_rows_to_excel(req.rows, path)
-        data = path.read_bytes()
+    buf = io.BytesIO()
+    write_rows_to_excel_stream(req.rows, buf)
     headers = {"Content-Disposition": 'attachment; filename="export.xlsx"'}
     return Response(
-        content=data,
+        content=buf.getvalue(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers=headers,
     )
@@ -480,8 +579,6 @@ def ml_predict_api(req: MLPredictRequest) -> MLPredictResponse:
         # Initialize lazily if needed
         _init_default_ml_model()
         if _ml_model is None:
-            from fastapi import HTTPException
-
             raise HTTPException(status_code=500, detail="model not available")
     preds = ml_predict(_ml_model, req.rows)
     return MLPredictResponse(predictions=preds)
@@ -511,8 +608,6 @@ class MLTrainResponse(BaseModel):
 def ml_train_api(req: MLTrainRequest) -> MLTrainResponse:
     global _ml_model
     if len(req.x) != len(req.y):
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=400, detail="x and y lengths differ")
     model = train_linear_regression(req.x, req.y, normalize=req.normalize)
     if req.set_default:
@@ -528,15 +623,11 @@ async def websocket_metrics(websocket: WebSocket) -> None:
     """WebSocket endpoint for real-time system metrics."""
     await _ws_manager.connect(websocket)
     try:
-        # Keep connection alive and handle any incoming messages
+        # We don't expect client messages for metrics, but need to listen to detect
+        # disconnections. receive_text() blocks until a frame or a disconnect arrives,
+        # so idle clients cost no wakeups; liveness is left to the server's WS pings.
         while True:
-            # We don't expect client messages for metrics, but need to listen
-            # to detect disconnections
-            try:
-                await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
-            except asyncio.TimeoutError:
-                # No message received, continue
-                continue
+            await websocket.receive_text()
     except WebSocketDisconnect:
         _ws_manager.disconnect(websocket)
     except Exception as e:
@@ -545,7 +636,7 @@ async def websocket_metrics(websocket: WebSocket) -> None:
 
 
 @app.get("/monitor/connections")
-def get_websocket_connections() -> dict[str, int]:
+async def get_websocket_connections() -> dict[str, int]:
     """Get current WebSocket connection count."""
     return {"active_connections": _ws_manager.get_connection_count()}
 
@@ -591,7 +682,7 @@ def tip(seed: int | None = None) -> dict[str, object]:
 
 
 @app.get("/fortune")
-def fortune(seed: int | None = None) -> dict[str, object]:
+async def fortune(seed: int | None = None) -> dict[str, object]:
     """Return a short fortune-like one-liner. Optional seed for reproducibility."""
     fortunes = [
         "A small step today leads to big results tomorrow.",
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import math
 import threading
-import time
+import types
 from collections import OrderedDict
+from time import monotonic
 from typing import Any, Generic, TypeVar
 
 K = TypeVar("K")
@@ -19,22 +21,29 @@ V = TypeVar("V")
 
 
 class LRUCache(Generic[K, V]):
-    """Thread-safe LRU cache with optional TTL (time-to-live in seconds)."""
+    """Thread-safe LRU cache with optional TTL (time-to-live in seconds).
+
+    Ages are measured with :func:`time.monotonic`, so wall-clock adjustments
+    cannot expire entries early or keep them alive.
+    """
 
     def __init__(self, maxsize: int = 128, ttl: int | float | None = None) -> None:
         self.maxsize = maxsize
         self.ttl = ttl
+        # key -> (value, absolute expiry on the monotonic clock; math.inf without a TTL)
         self.cache: OrderedDict[K, tuple[V, float]] = OrderedDict()
         self.lock = threading.Lock()
 
-    def get(self, key: K) -> V | None:
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for ``key``, or ``default`` if absent or expired."""
         with self.lock:
-            if key not in self.cache:
-                return None
-            value, created = self.cache[key]
-            if self.ttl and time.time() - created > self.ttl:
+            entry = self.cache.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < monotonic():
                 del self.cache[key]
-                return None
+                return default
             self.cache.move_to_end(key)
             return value
 
@@ -44,30 +53,64 @@ class LRUCache(Generic[K, V]):
                 del self.cache[key]
             elif len(self.cache) >= self.maxsize:
                 self.cache.popitem(last=False)
-            self.cache[key] = (value, time.time())
+            self.cache[key] = (value, monotonic() + self.ttl if self.ttl else math.inf)
 
     def clear(self) -> None:
         with self.lock:
             self.cache.clear()
 
 
+class ShardedLRUCache(Generic[K, V]):
+    """LRU cache striped over independent :class:`LRUCache` shards.
+
+    Each key hashes to one shard, so threads touching different keys rarely
+    contend on the same lock. Recency and ``maxsize`` are tracked per shard
+    (each holds ``ceil(maxsize / n_shards)`` entries), so eviction is only
+    approximately LRU across the whole cache.
+    """
+
+    def __init__(
+        self, maxsize: int = 128, ttl: int | float | None = None, n_shards: int = 16
+    ) -> None:
+        if n_shards < 1 or n_shards & (n_shards - 1):
+            raise ValueError("n_shards must be a power of two")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._mask = n_shards - 1
+        per_shard = max(1, -(-maxsize // n_shards))
+        self._shards: list[LRUCache[K, V]] = [LRUCache(per_shard, ttl) for _ in range(n_shards)]
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        return self._shards[hash(key) & self._mask].get(key, default)
+
+    def set(self, key: K, value: V) -> None:
+        self._shards[hash(key) & self._mask].set(key, value)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+
 class AsyncLRUCache(Generic[K, V]):
     """Async-safe LRU cache with optional TTL."""
 
     def __init__(self, maxsize: int = 128, ttl: int | float | None = None) -> None:
         self.maxsize = maxsize
         self.ttl = ttl
+        # key -> (value, absolute expiry on the monotonic clock; math.inf without a TTL)
         self.cache: OrderedDict[K, tuple[V, float]] = OrderedDict()
         self.lock = asyncio.Lock()
 
-    async def get(self, key: K) -> V | None:
+    async def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for ``key``, or ``default`` if absent or expired."""
         async with self.lock:
-            if key not in self.cache:
-                return None
-            value, created = self.cache[key]
-            if self.ttl and time.time() - created > self.ttl:
+            entry = self.cache.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < monotonic():
                 del self.cache[key]
-                return None
+                return default
             self.cache.move_to_end(key)
             return value
 
@@ -77,7 +120,7 @@ class AsyncLRUCache(Generic[K, V]):
                 del self.cache[key]
             elif len(self.cache) >= self.maxsize:
                 self.cache.popitem(last=False)
-            self.cache[key] = (value, time.time())
+            self.cache[key] = (value, monotonic() + self.ttl if self.ttl else math.inf)
 
     async def clear(self) -> None:
         async with self.lock:
@@ -92,44 +135,155 @@ def _kwargs_key(kwargs: dict[str, Any]) -> tuple[tuple[str, str], ...]:
     return tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
 
 
-def cache(maxsize: int = 128, ttl: int | float | None = None) -> Any:
-    """Decorator for function result caching (synchronous functions)."""
+# Returned by ``get`` on a miss so cached ``None`` results still count as hits.
+_MISS: Any = object()
 
-    def decorator(func: Any) -> Any:
-        store: LRUCache[tuple, Any] = LRUCache(maxsize, ttl)
+# Separates positional args from the kwargs part so the two can never collide.
+_KWD_MARK = object()
 
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key = (args, _kwargs_key(kwargs))
-            cached = store.get(key)
-            if cached is not None:
-                return cached
-            result = func(*args, **kwargs)
-            store.set(key, result)
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, ...]:
+    """Build the cache key for a call.
+
+    Positional-only calls use ``args`` as-is; hashable kwargs go into a frozenset
+    (no sort, no repr). Only unhashable kwarg values fall back to :func:`_kwargs_key`.
+    """
+    if not kwargs:
+        return args
+    try:
+        return (*args, _KWD_MARK, frozenset(kwargs.items()))
+    except TypeError:
+        return (*args, _KWD_MARK, _kwargs_key(kwargs))
+
+
+class _InFlight:
+    """A call in progress; concurrent callers for the same key wait on it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _Cached:
+    """Callable returned by :func:`cache`; holds the store and in-flight table.
+
+    State lives on plain attributes (``store``, ``inflight``) so it can be
+    inspected or cleared. ``functools.update_wrapper`` copies the wrapped
+    function's metadata into the instance ``__dict__``, and ``__get__`` makes
+    decorated methods still bind ``self``.
+    """
+
+    def __init__(
+        self,
+        func: Any,
+        store: LRUCache[tuple[Any, ...], Any] | ShardedLRUCache[tuple[Any, ...], Any],
+    ) -> None:
+        self.func = func
+        self.store = store
+        self.inflight: dict[tuple[Any, ...], _InFlight] = {}
+        self.inflight_lock = threading.Lock()
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = _make_key(args, kwargs)
+        cached = self.store.get(key, _MISS)
+        if cached is not _MISS:
+            return cached
+        with self.inflight_lock:
+            call = self.inflight.get(key)
+            leader = call is None
+            if call is None:
+                # A previous leader may have published and left between our miss and
+                # taking the lock; it stores before leaving, so look again here.
+                cached = self.store.get(key, _MISS)
+                if cached is not _MISS:
+                    return cached
+                call = self.inflight[key] = _InFlight()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            result = self.func(*args, **kwargs)
+            self.store.set(key, result)
+            call.result = result
             return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.inflight_lock:
+                del self.inflight[key]
+            call.done.set()
+
+
+def cache(maxsize: int = 128, ttl: int | float | None = None, shards: int = 1) -> Any:
+    """Decorator for function result caching (synchronous functions).
+
+    Concurrent misses for the same key are coalesced: the first caller computes
+    the result and the others wait for it instead of computing it again.
+    With ``shards > 1`` the results live in a :class:`ShardedLRUCache`, which
+    reduces lock contention for functions called from many threads.
+    """
 
-        return wrapper
+    def decorator(func: Any) -> Any:
+        store: LRUCache[tuple[Any, ...], Any] | ShardedLRUCache[tuple[Any, ...], Any] = (
+            ShardedLRUCache(maxsize, ttl, shards) if shards > 1 else LRUCache(maxsize, ttl)
+        )
+        return functools.update_wrapper(_Cached(func, store), func)
 
     return decorator
 
 
 def async_cache(maxsize: int = 128, ttl: int | float | None = None) -> Any:
-    """Decorator for async function result caching."""
+    """Decorator for async function result caching.
+
+    Concurrent misses for the same key share one in-flight computation. It runs
+    in its own task, so cancelling any caller (including the first) leaves the
+    others waiting for the result.
+    """
 
     def decorator(func: Any) -> Any:
-        store: AsyncLRUCache[tuple, Any] = AsyncLRUCache(maxsize, ttl)
+        store: AsyncLRUCache[tuple[Any, ...], Any] = AsyncLRUCache(maxsize, ttl)
+        inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+        async def fill(key: tuple[Any, ...], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            # A previous computation may have finished while the caller awaited
+            # its first lookup; it stores before leaving ``inflight``, so look again.
+            result = await store.get(key, _MISS)
+            if result is _MISS:
+                result = await func(*args, **kwargs)
+                await store.set(key, result)
+            return result
+
+        def finished(key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+            if inflight.get(key) is task:
+                del inflight[key]
+            if not task.cancelled():
+                task.exception()  # mark retrieved in case every caller went away
 
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key = (args, _kwargs_key(kwargs))
-            cached = await store.get(key)
-            if cached is not None:
+            key = _make_key(args, kwargs)
+            cached = await store.get(key, _MISS)
+            if cached is not _MISS:
                 return cached
-            result = await func(*args, **kwargs)
-            await store.set(key, result)
-            return result
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fill(key, args, kwargs))
+                inflight[key] = task
+                task.add_done_callback(functools.partial(finished, key))
+            # shield: a cancelled caller must not cancel the shared computation.
+            return await asyncio.shield(task)
 
         return wrapper
 
     return decorator
-
@@ -2,25 +2,16 @@ from __future__ import annotations
 
 # Updated 2026-03-09
 
+import csv
 import json
 from importlib import metadata as _metadata
 
 import typer
 
-from .algorithms import binary_search, fibonacci, fibonacci_fast, gcd
-from .config import load_config
-from .connectors import Connector, FileSystemConnector, SQLiteConnector
-from .excel_tools import write_rows_to_excel
 from .logging_utils import configure_logging_from_cli
-from .ml_pipeline import (
-    add_bias_feature,
-    load_model,
-    predict,
-    save_model,
-    train_linear_regression,
-)
-from .monitor import ping_url, send_slack_webhook
-from .vin import compute_check_digit, decode_vin, generate_vin, is_valid_vin
+
+# Command dependencies (numpy/sklearn, openpyxl, ...) are imported inside each
+# command so `--help` and unrelated commands don't pay for them.
 
 app = typer.Typer(help="Python Mastery Portfolio CLI")
 
@@ -29,6 +20,8 @@ app = typer.Typer(help="Python Mastery Portfolio CLI")
 def _global_options(ctx: typer.Context, verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"), config: str | None = typer.Option(None, "--config", "-c", help="Path to TOML config file"), json_logs: bool = typer.Option(False, "--json-logs", help="Emit logs in JSON format"),) -> None:
     configure_logging_from_cli(verbose=verbose, json_output=json_logs)
     if config:
+        from .config import load_config
+
         try:
             ctx.obj = {"config": load_config(config)}
         except Exception:
@@ -43,6 +36,8 @@ def fib(
     width: int = typer.Option(40, "--width", "-w", help="Width of ASCII bars when using --ascii"),
 ) -> None:
     """Compute the n-th Fibonacci number or show an ASCII visualization of the sequence up to n."""
+    from .algorithms import fibonacci
+
     if ascii_out:
         # Show sequence from 0..n as small bars scaled to provided width
         vals = [fibonacci(i) for i in range(n + 1)]
@@ -66,6 +61,8 @@ def gcd_cmd(
     b: int = typer.Argument(..., help="Second integer"),
 ) -> None:
     """Compute the greatest common divisor of two integers."""
+    from .algorithms import gcd
+
     try:
         res = gcd(a, b)
     except ValueError as e:
@@ -78,6 +75,8 @@ def benchmark_cmd(n: int = typer.Option(20, "--n", "-n"), iterations: int = type
     import time
     from statistics import mean
 
+    from .algorithms import fibonacci_fast, fibonacci_iterative
+
     def time_func(func):
         for _ in range(warmup):
             func(n)
@@ -90,7 +89,7 @@ def benchmark_cmd(n: int = typer.Option(20, "--n", "-n"), iterations: int = type
 
     out = {}
     if method in ("iterative", "both"):
-        out["iterative"] = time_func(fibonacci)
+        out["iterative"] = time_func(fibonacci_iterative)
     if method in ("fast", "both"):
         out["fast"] = time_func(fibonacci_fast)
     if json_out:
@@ -115,6 +114,8 @@ def search_command(
     ),
 ) -> None:
     """Binary search for VALUE in a sorted list of IN items."""
+    from .algorithms import binary_search
+
     idx = binary_search(items, value)
     if idx >= 0:
         typer.echo(f"Found {value} at index {idx}")
@@ -139,12 +140,16 @@ def version_cmd() -> None:
 @app.command("vin-validate")
 def vin_validate(vin: str = typer.Argument(..., help="17-character VIN")) -> None:
     """Validate a VIN using ISO 3779 (check digit)."""
+    from .vin import is_valid_vin
+
     typer.echo("valid" if is_valid_vin(vin) else "invalid")
 
 
 @app.command("vin-check")
 def vin_check(vin: str = typer.Argument(..., help="17-character VIN")) -> None:
     """Print the computed check digit for a VIN."""
+    from .vin import compute_check_digit
+
     vin_u = vin.upper()
     if len(vin_u) != 17:
         raise typer.Exit(code=2)
@@ -154,6 +159,8 @@ def vin_check(vin: str = typer.Argument(..., help="17-character VIN")) -> None:
 @app.command("vin-decode")
 def vin_decode_cmd(vin: str = typer.Argument(..., help="17-character VIN")) -> None:
     """Decode a VIN (WMI/VDS/VIS, year, plant, region, brand)."""
+    from .vin import decode_vin
+
     dec = decode_vin(vin)
     # Print as lightweight key=value lines for readability
     fields = [
@@ -183,6 +190,8 @@ def vin_generate_cmd(
     serial: str = typer.Option(..., "--serial", help="Serial (6 chars)"),
 ) -> None:
     """Generate a valid VIN from components (computes check digit)."""
+    from .vin import generate_vin
+
     try:
         vin = generate_vin(wmi, vds, year, plant, serial)
     except ValueError as e:
@@ -199,10 +208,14 @@ def excel_export(
 ) -> None:
     """Create a simple Excel file from provided CSV-like rows.
 
+    Rows are parsed with the :mod:`csv` module, so quoted cells may contain commas.
+
     Example:
       pm-portfolio excel-export --output report.xlsx "Name,Score" "Alice,90" "Bob,88"
     """
-    parsed = [r.split(",") for r in rows]
+    from .excel_tools import write_rows_to_excel
+
+    parsed = list(csv.reader(rows))
     path = write_rows_to_excel(parsed, output)
     typer.echo(str(path))
 
@@ -218,6 +231,8 @@ def ml_train(
     normalize: bool = typer.Option(True, "--normalize/--no-normalize", help="Apply feature normalization (StandardScaler)"),
     batch_size: int | None = typer.Option(None, "--batch-size", help="Optional batch size (not used, reserved)"),
 ) -> None:
+    from .ml_pipeline import add_bias_feature, save_model, train_linear_regression
+
     rows = [[float(v) for v in r.split(",")] for r in x]
     if add_bias:
         rows = add_bias_feature(rows)
@@ -243,6 +258,8 @@ def ml_predict(
         False, "--add-bias", help="Prepend a bias feature (1.0) to each row"
     ),
 ) -> None:
+    from .ml_pipeline import add_bias_feature, load_model, predict, train_linear_regression
+
     x_rows = [[float(v) for v in r.split(",")] for r in rows]
     if add_bias:
         x_rows = add_bias_feature(x_rows)
@@ -273,6 +290,8 @@ def monitor_ping_cmd(
 ) -> None:
     import time as _t
 
+    from .monitor import ping_url, send_slack_webhook
+
     worst: float | None = None
     for _ in range(iterations):
         res = ping_url(url)
@@ -299,6 +318,8 @@ def ingest(
       pm-portfolio ingest ./docs --kind fs --output docs.jsonl
       pm-portfolio ingest data.db --kind sqlite --table documents --output data.jsonl
     """
+    from .connectors import Connector, FileSystemConnector, SQLiteConnector
+
     conn: Connector
     if kind == "fs":
         conn = FileSystemConnector(source)
@@ -8,29 +8,24 @@ performed case-insensitively.
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
-
-def _parse_toml_bytes(data: bytes) -> dict[str, Any]:
-    text = data.decode("utf-8")
+if sys.version_info >= (3, 11):
+    import tomllib as _toml
+else:  # pragma: no cover - Python < 3.11
     try:
-        from typing import cast
+        import tomli as _toml
+    except ImportError:
+        _toml = None
 
-        import tomllib  # type: ignore
-
-        return cast(dict[str, Any], tomllib.loads(text))
-    except Exception:
-        pass
-    try:
-        from typing import cast
 
-        import tomli  # type: ignore
-
-        return cast(dict[str, Any], tomli.loads(text))
-    except Exception:
-        pass
-    raise RuntimeError("TOML parser not available; install 'tomli' for Python<3.11")
+def _parse_toml_bytes(data: bytes) -> dict[str, Any]:
+    if _toml is None:
+        raise RuntimeError("TOML parser not available; install 'tomli' for Python<3.11")
+    parsed: dict[str, Any] = _toml.loads(data.decode("utf-8"))
+    return parsed
 
 
 def load_config(path: str | Path) -> dict[str, Any]:
@@ -50,6 +45,4 @@ def load_config(path: str | Path) -> dict[str, Any]:
     data = p.read_bytes()
     if p.suffix.lower() == ".toml":
         return _parse_toml_bytes(data)
-    from typing import cast
-
     return cast(dict[str, Any], json.loads(data.decode("utf-8")))
@@ -8,12 +8,18 @@ where appropriate to make them JSON-serializable.
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
+# Number of JSONL lines collected before each ``writelines`` call.
+_JSONL_BATCH_LINES = 1024
+# Rows pulled per ``fetchmany`` call when scanning SQLite tables.
+_SQLITE_FETCH_ROWS = 1000
+
 
 @dataclass
 class Document:
@@ -31,15 +37,51 @@ class Connector(ABC):
     def to_jsonl(self, out_path: str | Path) -> Path:
         p = Path(out_path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w", encoding="utf8") as f:
+        # Lines are handed to writelines in batches on top of a 1 MiB buffer,
+        # so large corpora cost a few big writes instead of one per document.
+        buf: list[str] = []
+        dumps = json.dumps
+        with p.open("w", encoding="utf8", buffering=1 << 20) as f:
             for doc in self.iter_documents():
-                f.write(json.dumps(asdict(doc), ensure_ascii=False) + "\n")
+                # A plain dict instead of asdict(), which deep-copies every field.
+                record = {"id": doc.id, "text": doc.text, "metadata": doc.metadata}
+                buf.append(dumps(record, ensure_ascii=False))
+                buf.append("\n")
+                if len(buf) >= _JSONL_BATCH_LINES * 2:
+                    f.writelines(buf)
+                    buf.clear()
+            f.writelines(buf)
         return p
 
 
 # --- Filesystem connector ----------------------------------------------------
 
 
+def _scan_files(root: str, recursive: bool) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under ``root`` using :func:`os.scandir`.
+
+    ``DirEntry`` caches the file type from the directory listing, so most
+    entries need no extra ``stat`` call. Symlinked directories are not
+    descended into; symlinked files are yielded.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
 class FileSystemConnector(Connector):
     """Read text files from a directory and yield Document instances."""
 
@@ -50,19 +92,14 @@ class FileSystemConnector(Connector):
         recursive: bool = True,
     ) -> None:
         self.root = Path(root)
-        self.extensions = [e.lower() for e in extensions or [".md", ".txt"]]
+        self.extensions = frozenset(e.lower() for e in extensions or (".md", ".txt"))
         self.recursive = recursive
 
     def iter_documents(self) -> Iterator[Document]:
-        if self.recursive:
-            files = self.root.rglob("*")
-        else:
-            files = self.root.glob("*")
-        for p in files:
-            if not p.is_file():
-                continue
-            if p.suffix.lower() not in self.extensions:
+        for entry in _scan_files(str(self.root), self.recursive):
+            if os.path.splitext(entry.name)[1].lower() not in self.extensions:
                 continue
+            p = Path(entry.path)
             try:
                 text = p.read_text(encoding="utf8")
             except Exception:
@@ -75,6 +112,11 @@ class FileSystemConnector(Connector):
 # --- SQLite connector (simple) ----------------------------------------------
 
 
+def _quote_ident(name: str) -> str:
+    """Quote a SQLite identifier so any table/column name is taken literally."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 class SQLiteConnector(Connector):
     """Read rows from a SQLite table and yield Document instances."""
 
@@ -94,17 +136,31 @@ class SQLiteConnector(Connector):
 
     def iter_documents(self) -> Iterator[Document]:
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cur = conn.cursor()
+        cur.arraysize = _SQLITE_FETCH_ROWS
         cols = [self.id_col, self.text_col] + self.metadata_cols
-        col_sql = ", ".join(cols)
-        sql = f"SELECT {col_sql} FROM {self.table}"
+        col_sql = ", ".join(map(_quote_ident, cols))
+        sql = f"SELECT {col_sql} FROM {_quote_ident(self.table)}"
+        meta_cols = tuple(self.metadata_cols)
         try:
-            for row in cur.execute(sql):
-                doc_id = str(row[self.id_col])
-                # Coerce text and metadata values to strings to ensure JSON-serializability
-                text = str(row[self.text_col]) if row[self.text_col] is not None else ""
-                meta: dict[str, object] = {c: (str(row[c]) if row[c] is not None else None) for c in self.metadata_cols}
-                yield Document(id=doc_id, text=text, metadata=meta)
+            cur.execute(sql)
+            # Plain tuples in selection order: id, text, then metadata columns.
+            while rows := cur.fetchmany():
+                for row in rows:
+                    doc_id = str(row[0])
+                    # Coerce text and metadata values to strings to ensure JSON-serializability
+                    text = str(row[1]) if row[1] is not None else ""
+                    vals = row[2:]
+                    # Common case (no NULLs) stays in C: zip + map(str) into dict().
+                    meta: dict[str, object] = dict(
+                        zip(
+                            meta_cols,
+                            map(str, vals)
+                            if None not in vals
+                            else [None if v is None else str(v) for v in vals],
+                            strict=True,
+                        )
+                    )
+                    yield Document(id=doc_id, text=text, metadata=meta)
         finally:
             conn.close()
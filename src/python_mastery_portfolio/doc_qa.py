@@ -12,7 +12,13 @@ import math
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Protocol
+
+from .caching import LRUCache
+
+# Cached query embeddings per index. Popular queries repeat a lot, and
+# embedding is the dominant cost of a search with model-backed embedders.
+_QUERY_CACHE_SIZE = 2048
 
 
 def _tokenize(text: str) -> list[str]:
@@ -115,6 +121,7 @@ class NaiveIndex:
         self._entries: list[_Entry] = []
         self._next_id = 1
         self._dim = 0
+        self._qcache: LRUCache[str, list[float]] = LRUCache(maxsize=_QUERY_CACHE_SIZE)
 
     def _fit_dim(self, v: list[float], dim: int) -> list[float]:
         if len(v) < dim:
@@ -125,6 +132,8 @@ class NaiveIndex:
 
     def add(self, texts: list[str]) -> list[int]:
         """Add texts to the index and return assigned integer ids."""
+        # New texts can grow the embedder's vocabulary/dimension.
+        self._qcache.clear()
         embs = self.embedder.embed(texts)
         # track maximum dimension and fit old entries
         self._dim = max(self._dim, self.embedder.dim())
@@ -144,14 +153,17 @@ class NaiveIndex:
         self._entries.clear()
         self._next_id = 1
         self._dim = 0
+        self._qcache.clear()
 
     def search(self, query: str, k: int) -> list[tuple[int, float, str]]:
         """Search for the top-k similar texts to ``query``.
 
         Returns a list of (id, score, text), sorted by score descending.
         """
-        q_emb = self.embedder.embed([query])[0]
-        q_emb = self._fit_dim(q_emb, self._dim)
+        q_emb = self._qcache.get(query)
+        if q_emb is None:
+            q_emb = self._fit_dim(self.embedder.embed([query])[0], self._dim)
+            self._qcache.set(query, q_emb)
         scored = [(e.id, _cosine(q_emb, e.emb), e.text) for e in self._entries]
         scored.sort(key=lambda t: t[1], reverse=True)
         return scored[: max(0, k)]
@@ -227,9 +239,21 @@ class SentenceTransformerEmbedder:
 
 
 class FaissIndex:
-    """Thin FAISS wrapper: uses FAISS if installed, otherwise raises on init."""
+    """Thin FAISS wrapper: uses FAISS if installed, otherwise raises on init.
+
+    By default vectors live in an exact ``IndexFlatIP``. Pass ``hnsw=True`` for
+    an approximate ``IndexHNSWFlat`` graph, which scales much better for large
+    corpora (tens of thousands of chunks and up) at a small recall cost.
+    """
 
-    def __init__(self, embedder: Embedder) -> None:
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        hnsw: bool = False,
+        hnsw_m: int = 32,
+        ef_search: int = 64,
+    ) -> None:
         import importlib
 
         try:
@@ -243,13 +267,25 @@ class FaissIndex:
         self._ids: list[int] = []
         self._next_id = 1
         self._dim = embedder.dim()
-        self._faiss = faiss.IndexFlatIP(self._dim)
+        self._hnsw = hnsw
+        self._hnsw_m = hnsw_m
+        self._ef_search = ef_search
+        self._faiss = self._new_faiss(faiss)
+        self._qcache: LRUCache[str, Any] = LRUCache(maxsize=_QUERY_CACHE_SIZE)
+
+    def _new_faiss(self, faiss: Any) -> Any:
+        if not self._hnsw:
+            return faiss.IndexFlatIP(self._dim)
+        index = faiss.IndexHNSWFlat(self._dim, self._hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efSearch = self._ef_search
+        return index
 
     def add(self, texts: list[str]) -> list[int]:
         import importlib
 
         np = importlib.import_module("numpy")
 
+        self._qcache.clear()
         ids: list[int] = []
         self._texts.extend(texts)
         for _ in texts:
@@ -260,15 +296,18 @@ class FaissIndex:
         vecs = self.embedder.embed(texts)
         arr = np.asarray(vecs, dtype="float32")
         norms = np.linalg.norm(arr, axis=1, keepdims=True) + 1e-12
-        arr = arr / norms
+        arr = np.ascontiguousarray(arr / norms)
         self._faiss.add(arr)
         return ids
 
     def reset(self) -> None:
+        import importlib
+
         self._texts.clear()
         self._ids.clear()
         self._next_id = 1
-        self._faiss = type(self._faiss)(self._dim)
+        self._faiss = self._new_faiss(importlib.import_module("faiss"))
+        self._qcache.clear()
 
     def search(self, query: str, k: int) -> list[tuple[int, float, str]]:
         import importlib
@@ -277,9 +316,12 @@ class FaissIndex:
 
         if not self._texts or k <= 0:
             return []
-        v = self.embedder.embed([query])[0]
-        arr = np.asarray([v], dtype="float32")
-        arr = arr / (np.linalg.norm(arr, axis=1, keepdims=True) + 1e-12)
+        arr = self._qcache.get(query)
+        if arr is None:
+            v = self.embedder.embed([query])[0]
+            arr = np.asarray([v], dtype="float32")
+            arr = np.ascontiguousarray(arr / (np.linalg.norm(arr, axis=1, keepdims=True) + 1e-12))
+            self._qcache.set(query, arr)
         scores, idxs = self._faiss.search(arr, k)
         out: list[tuple[int, float, str]] = []
         for rank, pos in enumerate(idxs[0]):
@@ -430,6 +472,8 @@ class QAService:
             idx: Index = NaiveIndex(emb)
         elif index_name == "faiss":
             idx = FaissIndex(emb)  # may raise if faiss not installed
+        elif index_name == "faiss-hnsw":
+            idx = FaissIndex(emb, hnsw=True)
         else:
             raise ValueError("unknown index")
 
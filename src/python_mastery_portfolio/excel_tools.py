@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from importlib import import_module
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, BinaryIO, cast
 
 # Dynamically import openpyxl to avoid static analysis errors when the
 # optional dependency is not installed in the edit environment.
@@ -31,11 +31,26 @@ def write_rows_to_excel(rows: Iterable[Iterable[str]], output_path: str | Path)
     estimated from the longest cell in each column. The output directory
     will be created if it does not exist.
     """
+    wb = _build_workbook(rows)
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(path)
+    return path
+
+
+def write_rows_to_excel_stream(rows: Iterable[Iterable[str]], fileobj: BinaryIO) -> None:
+    """Write rows to an Excel workbook in the binary file object ``fileobj``.
+
+    Same layout as :func:`write_rows_to_excel`, without touching the filesystem
+    (e.g. pass an ``io.BytesIO`` to build the workbook in memory).
+    """
+    _build_workbook(rows).save(fileobj)
+
+
+def _build_workbook(rows: Iterable[Iterable[str]]) -> Any:
     if Workbook is None:
         raise ImportError("openpyxl is required for write_rows_to_excel; please install it (pip install openpyxl)")
 
-    path = Path(output_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
     wb = cast(Any, Workbook)()
     ws = cast(Worksheet, wb.active)
     ws.title = "Data"
@@ -44,8 +59,7 @@ def write_rows_to_excel(rows: Iterable[Iterable[str]], output_path: str | Path)
     try:
         header = next(rows_iter)
     except StopIteration:
-        wb.save(path)
-        return path
+        return wb
 
     ws.append(list(header))
     for cell in ws[1]:
@@ -69,5 +83,4 @@ def write_rows_to_excel(rows: Iterable[Iterable[str]], output_path: str | Path)
             letter = "".join(ch for ch in str(coord) if ch.isalpha()) or "A"
         ws.column_dimensions[letter].width = max(10, min(max_len + 2, 40))
 
-    wb.save(path)
-    return path
+    return wb
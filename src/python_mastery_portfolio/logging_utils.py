@@ -6,8 +6,11 @@ logging configuration based on CLI flags or programmatic needs.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 
 class JsonFormatter(logging.Formatter):
@@ -39,15 +42,43 @@ def configure_logging_from_cli(verbose: bool = False, json_output: bool = False)
     root.handlers = [handler]
 
 
-def setup_json_logging(level: int | None = None) -> None:
+def setup_json_logging(level: int | None = None, *, background: bool = False) -> None:
     """Programmatic shortcut to enable JSON logging on the root logger.
 
     Args:
         level: Optional numeric logging level to set on the root logger.
+        background: When true, records are rendered to JSON by the caller but
+            written to the stream by a :class:`~logging.handlers.QueueListener`
+            thread, so logging never blocks the caller on I/O.
     """
+    global _listener
     root = logging.getLogger()
     if level is not None:
         root.setLevel(level)
     handler = logging.StreamHandler()
-    handler.setFormatter(JsonFormatter())
-    root.handlers = [handler]
+    if not background:
+        handler.setFormatter(JsonFormatter())
+        root.handlers = [handler]
+        return
+    _stop_listener()
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    queue_handler.setFormatter(JsonFormatter())
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(records, handler)
+    _listener.start()
+    root.handlers = [queue_handler]
+
+
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush and stop the background listener, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
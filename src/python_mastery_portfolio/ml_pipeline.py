@@ -7,7 +7,7 @@ with optional feature scaling and utilities to save/load models.
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import cast
 
@@ -21,6 +21,27 @@ from sklearn.preprocessing import StandardScaler
 class TrainedModel:
     scaler: StandardScaler | None
     model: LinearRegression
+    _folded: tuple[np.ndarray, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def folded_weights(self) -> tuple[np.ndarray, float]:
+        """Return ``(w, b)`` with the scaler folded in, so ``x @ w + b`` predicts raw rows.
+
+        Standardizing then applying the model is ``((x - mean) / scale) @ coef + intercept``,
+        which equals ``x @ (coef / scale) + (intercept - mean @ (coef / scale))``. The
+        result is computed once and kept as a contiguous float64 vector.
+        """
+        if self._folded is None:
+            w = np.asarray(self.model.coef_, dtype=np.float64)
+            b = float(self.model.intercept_)
+            if self.scaler is not None:
+                if self.scaler.scale_ is not None:
+                    w = w / self.scaler.scale_
+                if self.scaler.mean_ is not None:
+                    b -= float(self.scaler.mean_ @ w)
+            self._folded = (np.ascontiguousarray(w), b)
+        return self._folded
 
 
 def train_linear_regression(x: Sequence[Sequence[float]], y: Sequence[float], normalize: bool = True) -> TrainedModel:
@@ -48,13 +69,15 @@ def train_linear_regression(x: Sequence[Sequence[float]], y: Sequence[float], no
 
 
 def predict(trained: TrainedModel, rows: Iterable[Sequence[float]]) -> list[float]:
-    """Predict numeric values for given feature rows using a trained model."""
+    """Predict numeric values for given feature rows using a trained model.
+
+    Uses the model's folded weights, so prediction is a single matrix-vector
+    product with no per-call scaling pass or scikit-learn input validation.
+    """
     xm = np.asarray(list(rows), dtype=float)
-    if trained.scaler is not None:
-        preds = trained.model.predict(trained.scaler.transform(xm))
-    else:
-        preds = trained.model.predict(xm)
-    return [float(v) for v in preds.tolist()]
+    w, b = trained.folded_weights()
+    preds = xm @ w + b
+    return cast(list[float], preds.tolist())
 
 
 def save_model(tm: TrainedModel, path: str | Path) -> Path:
@@ -11,6 +11,7 @@ import time
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
+from functools import lru_cache
 try:
     from prometheus_client import Histogram  # type: ignore
 except Exception:  # pragma: no cover - optional
@@ -27,6 +28,16 @@ else:
     PING_HISTOGRAM: Any = None
 
 
+@lru_cache(maxsize=1024)
+def _ping_histogram_child(url: str) -> Any:
+    """Return the labelled histogram child for ``url``.
+
+    ``labels()`` takes the metric-wide lock to find or create the child; caching
+    the child leaves only its own lock on the observe path.
+    """
+    return PING_HISTOGRAM.labels(url)
+
+
 @dataclass
 class PingResult:
     url: str
@@ -51,7 +62,7 @@ def ping_url(url: str, timeout: float = 5.0) -> PingResult:
         ok = False
     elapsed = time.perf_counter() - start
     if PING_HISTOGRAM is not None:
-        PING_HISTOGRAM.labels(url).observe(elapsed)
+        _ping_histogram_child(url).observe(elapsed)
     return PingResult(url=url, ok=ok, status=status, seconds=elapsed)
 
 
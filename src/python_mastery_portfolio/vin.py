@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from operator import mul
 from typing import Final
 
 # Transliteration map per ISO 3779 (letters to numbers)
@@ -38,7 +39,14 @@ TRANSLITERATION: Final[dict[str, int]] = {
 # Position weights per ISO 3779 for positions 1..17
 WEIGHTS: Final[list[int]] = [8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2]
 
+# TRANSLITERATION as a 256-entry byte table indexed by ASCII code, for bytes.translate.
+_INVALID: Final[int] = 0xFF
+_TRANSLITERATION_TABLE: Final[bytes] = bytes(
+    TRANSLITERATION.get(chr(i), _INVALID) for i in range(256)
+)
+
 _VIN_ALLOWED_RE = re.compile(r"^[A-HJ-NPR-Z0-9]{17}$")  # Exclude I, O, Q
+_VIN_DISALLOWED_CHAR_RE = re.compile(r"[^A-HJ-NPR-Z0-9]")
 
 
 def normalize_vin(vin: str) -> str:
@@ -46,10 +54,14 @@ def normalize_vin(vin: str) -> str:
 
 
 def compute_check_digit(vin: str) -> str:
-    total = 0
-    for i, ch in enumerate(vin):
-        value = TRANSLITERATION[ch]
-        total += value * WEIGHTS[i]
+    if len(vin) > len(WEIGHTS):
+        raise ValueError("VIN must be at most 17 characters")
+    # Non-ASCII characters become "?", which the table marks invalid like I/O/Q.
+    values = vin.encode("ascii", "replace").translate(_TRANSLITERATION_TABLE)
+    bad = values.find(_INVALID)
+    if bad != -1:
+        raise KeyError(vin[bad])
+    total = sum(map(mul, values, WEIGHTS))
     r = total % 11
     return "X" if r == 10 else str(r)
 
@@ -86,6 +98,7 @@ _YEAR_LETTERS: Final[list[str]] = [
     "X",
     "Y",
 ]
+_YEAR_LETTER_INDEX: Final[dict[str, int]] = {c: i for i, c in enumerate(_YEAR_LETTERS)}
 
 
 def get_model_year(code: str) -> int | None:
@@ -94,8 +107,9 @@ def get_model_year(code: str) -> int | None:
     c = code.upper()
     if c.isdigit() and c in {"1","2","3","4","5","6","7","8","9"}:
         return 2000 + int(c)
-    if c in _YEAR_LETTERS:
-        return 2010 + _YEAR_LETTERS.index(c)
+    idx = _YEAR_LETTER_INDEX.get(c)
+    if idx is not None:
+        return 2010 + idx
     return None
 
 
@@ -182,8 +196,8 @@ def decode_vin(vin: str) -> VinDecoded:
         if c in {"1","2","3","4","5","6","7","8","9"}:
             base = 2000 + int(c)
             return [base] + ([base + 30] if base <= 2009 else [])
-        if c in _YEAR_LETTERS:
-            idx = _YEAR_LETTERS.index(c)
+        idx = _YEAR_LETTER_INDEX.get(c)
+        if idx is not None:
             return [1980 + idx, 2010 + idx]
         return None
 
@@ -203,7 +217,7 @@ def decode_vin(vin: str) -> VinDecoded:
 
 def _ensure_allowed_chars(s: str, length: int, pad: str = "0") -> str:
     s_u = normalize_vin(s)
-    s_u = re.sub(r"[^A-HJ-NPR-Z0-9]", pad, s_u)
+    s_u = _VIN_DISALLOWED_CHAR_RE.sub(pad, s_u)
     if len(s_u) < length:
         s_u = s_u + pad * (length - len(s_u))
     return s_u[:length]
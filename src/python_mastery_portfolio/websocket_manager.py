@@ -9,9 +9,12 @@ logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    def __init__(self) -> None:
+    def __init__(self, send_timeout: float = 5.0) -> None:
         self.active_connections: list[WebSocket] = []
         self._broadcast_lock = asyncio.Lock()
+        # A client that cannot take a frame within this many seconds is dropped,
+        # so one slow socket cannot stall the broadcast for everyone else.
+        self.send_timeout = send_timeout
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
@@ -31,19 +34,33 @@ class ConnectionManager:
             self.disconnect(websocket)
 
     async def broadcast(self, message: str) -> None:
+        """Send ``message`` to every connection concurrently.
+
+        Each send is bounded by ``send_timeout``; clients that miss it are closed
+        and dropped so they cannot hold the broadcast lock.
+        """
         if not self.active_connections:
             return
         async with self._broadcast_lock:
             conns = self.active_connections.copy()
-            tasks = [asyncio.create_task(self._safe_send(c, message)) for c in conns]
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(
+                *(self._safe_send(c, message) for c in conns), return_exceptions=True
+            )
 
     async def _safe_send(self, websocket: WebSocket, message: str) -> None:
         try:
-            await websocket.send_text(message)
+            await asyncio.wait_for(websocket.send_text(message), timeout=self.send_timeout)
         except WebSocketDisconnect:
             self.disconnect(websocket)
+        except asyncio.TimeoutError:
+            logger.warning("websocket_send_timeout", extra={"timeout": self.send_timeout})
+            # Close it too: otherwise the handler stays parked in receive_text() and
+            # the client sits on a live socket that silently gets no more frames.
+            try:
+                await asyncio.wait_for(websocket.close(), timeout=self.send_timeout)
+            except Exception as e:  # noqa: BLE001 - already dropping this client
+                logger.debug("websocket_close_failed", extra={"error": str(e)})
+            self.disconnect(websocket)
         except Exception as e:
             logger.warning("websocket_broadcast_failed", extra={"error": str(e)})
             self.disconnect(websocket)
@@ -9,6 +9,7 @@ from python_mastery_portfolio import (
     cache,
     async_cache,
     LRUCache,
+    ShardedLRUCache,
     DIContainer,
     LifecycleScope,
     Container,
@@ -92,6 +93,16 @@ class TestCaching:
         assert cache.get("a") is None
         assert cache.get("b") == 2
 
+    def test_sharded_lru_cache(self):
+        cache = ShardedLRUCache(maxsize=64, n_shards=4)
+        for i in range(32):
+            cache.set(i, i * 2)
+        assert all(cache.get(i) == i * 2 for i in range(32))
+        cache.clear()
+        assert cache.get(0) is None
+        with pytest.raises(ValueError):
+            ShardedLRUCache(n_shards=3)
+
     def test_cache_decorator(self):
         call_count = 0
         @cache(maxsize=10)
@@ -104,6 +115,48 @@ class TestCaching:
         assert expensive(5) == 10
         assert call_count == 1
 
+    def test_cache_decorator_on_method(self):
+        class Doubler:
+            calls = 0
+
+            @cache(maxsize=10)
+            def double(self, x: int) -> int:
+                """Double x."""
+                Doubler.calls += 1
+                return x * 2
+
+        d = Doubler()
+        assert d.double(3) == 6
+        assert d.double(3) == 6
+        assert Doubler.calls == 1
+        assert Doubler.double.__name__ == "double"
+        assert Doubler.double.__doc__ == "Double x."
+
+    def test_cache_decorator_caches_none(self):
+        call_count = 0
+        @cache(maxsize=10)
+        def lookup(x: int):
+            nonlocal call_count
+            call_count += 1
+            return None
+        assert lookup(1) is None
+        assert lookup(1) is None
+        assert call_count == 1
+
+    def test_cache_decorator_kwargs(self):
+        call_count = 0
+        @cache(maxsize=10)
+        def combine(x, **opts):
+            nonlocal call_count
+            call_count += 1
+            return x
+        combine(1, a=1, b=2)
+        combine(1, b=2, a=1)  # kwargs order does not matter
+        assert call_count == 1
+        combine(1, a=[1, 2])
+        combine(1, a=[1, 2])  # unhashable kwarg values still cache
+        assert call_count == 2
+
     @pytest.mark.asyncio
     async def test_async_cache(self):
         call_count = 0
@@ -117,6 +170,73 @@ class TestCaching:
         assert await async_expensive(4) == 12
         assert call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_async_cache_coalesces_concurrent_misses(self):
+        call_count = 0
+        @async_cache(maxsize=10)
+        async def slow(x: int):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x + 1
+        results = await asyncio.gather(*(slow(1) for _ in range(5)))
+        assert results == [2] * 5
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_cache_leader_cancel_does_not_cancel_waiters(self):
+        call_count = 0
+        @async_cache(maxsize=10)
+        async def slow(x: int):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)
+            return x + 1
+        leader = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter == 2
+        assert leader.cancelled()
+        assert call_count == 1
+
+    def test_cache_coalesces_concurrent_misses(self):
+        import threading
+        import time
+
+        call_count = 0
+        @cache(maxsize=10)
+        def slow(x: int):
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.02)
+            return x + 1
+        threads = [threading.Thread(target=slow, args=(1,)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert call_count == 1
+
+
+    def test_cache_rechecks_store_before_leading(self):
+        from python_mastery_portfolio import caching
+
+        call_count = 0
+        @cache(maxsize=10)
+        def compute(x: int):
+            nonlocal call_count
+            call_count += 1
+            return x
+        compute(1)
+        # Simulate a caller whose first lookup raced ahead of the previous leader.
+        real_get = compute.store.get
+        misses = iter([caching._MISS])
+        compute.store.get = lambda key, default=None: next(misses, None) or real_get(key, default)
+        assert compute(1) == 1
+        assert call_count == 1
+
 
 class TestDIContainer:
     def test_register_singleton(self):
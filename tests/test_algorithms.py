@@ -2,7 +2,14 @@ from __future__ import annotations
 
 import pytest
 
-from python_mastery_portfolio.algorithms import binary_search, fibonacci, fibonacci_fast, gcd
+from python_mastery_portfolio import algorithms
+from python_mastery_portfolio.algorithms import (
+    binary_search,
+    fibonacci,
+    fibonacci_fast,
+    fibonacci_iterative,
+    gcd,
+)
 
 
 @pytest.mark.parametrize(
@@ -34,6 +41,20 @@ def test_binary_search_found() -> None:
 def test_binary_search_not_found() -> None:
     data = [10, 20, 30]
     assert binary_search(data, 15) == -1
+    assert binary_search(data, 40) == -1
+    assert binary_search([], 1) == -1
+
+
+def test_binary_search_duplicates_returns_first() -> None:
+    assert binary_search([1, 2, 2, 2, 3], 2) == 1
+
+
+def test_binary_search_numpy_array() -> None:
+    np = pytest.importorskip("numpy")
+    data = np.array([1, 3, 5, 7, 9], dtype=np.int64)
+    assert binary_search(data, 7) == 3
+    assert binary_search(data, 4) == -1
+    assert binary_search(data, 10) == -1
 
 
 @pytest.mark.parametrize(
@@ -61,7 +82,15 @@ def test_gcd_both_zero() -> None:
     [0, 1, 2, 3, 10, 50, 200, 1000],
 )
 def test_fibonacci_fast_matches_iterative(n: int) -> None:
-    assert fibonacci_fast(n) == fibonacci(n)
+    assert fibonacci_fast(n) == fibonacci_iterative(n)
+    assert fibonacci(n) == fibonacci_iterative(n)
+
+
+def test_fibonacci_fast_big_int_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Exercise the gmpy2 dispatch with plain ints standing in for mpz.
+    monkeypatch.setattr(algorithms, "_mpz", int)
+    monkeypatch.setattr(algorithms, "_FIB_GMPY2_MIN", 10)
+    assert fibonacci_fast(300) == fibonacci_iterative(300)
 
 
 def test_fibonacci_fast_negative() -> None:
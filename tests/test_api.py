@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
 
+from python_mastery_portfolio import api
 from python_mastery_portfolio.api import app
 
 
@@ -23,6 +25,16 @@ def test_fib_endpoint_negative() -> None:
     assert data["value"] == 0
 
 
+def test_fib_endpoint_does_not_cache_large_n() -> None:
+    client = TestClient(app)
+    api._fib_cached.cache_clear()
+    n = api._FIB_CACHE_MAX_N + 1
+    assert client.get(f"/fib/{n}").status_code == 200
+    assert api._fib_cached.cache_info().currsize == 0
+    assert client.get("/fib/10").status_code == 200
+    assert api._fib_cached.cache_info().currsize == 1
+
+
 def test_vin_validate_api() -> None:
     client = TestClient(app)
     r = client.post("/vin/validate", json={"vin": "1HGCM82633A004352"})
@@ -31,6 +43,31 @@ def test_vin_validate_api() -> None:
     assert data == {"vin": "1HGCM82633A004352", "valid": True}
 
 
+def test_vin_validate_batch_api() -> None:
+    client = TestClient(app)
+    r = client.post(
+        "/vin/validate_batch",
+        json={"vins": ["1HGCM82633A004352", "1HGCM82633A004353", "short"]},
+    )
+    assert r.status_code == 200
+    assert r.json() == {"valid": [True, False, False]}
+
+
+def test_vin_validate_batch_charges_rate_limit_per_vin(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "_rate_buckets", {})
+    monkeypatch.setattr(api, "monotonic", lambda: 600.0)
+    client = TestClient(app)
+    vins = ["1HGCM82633A004352"] * 100
+    assert client.post("/vin/validate_batch", json={"vins": vins}).status_code == 200
+    # 100 of the 120 hits are used: another 100-VIN batch no longer fits...
+    assert client.post("/vin/validate_batch", json={"vins": vins}).status_code == 429
+    # ...but the remaining 20 single requests do.
+    body = {"vin": "1HGCM82633A004352"}
+    for _ in range(api._RATE_LIMIT_MAX - len(vins)):
+        assert client.post("/vin/validate", json=body).status_code == 200
+    assert client.post("/vin/validate", json=body).status_code == 429
+
+
 def test_request_id_propagation() -> None:
     client = TestClient(app)
     rid = "abc123"
@@ -63,3 +100,33 @@ def test_gcd_endpoint_both_zero() -> None:
     client = TestClient(app)
     r = client.get("/math/gcd", params={"a": 0, "b": 0})
     assert r.status_code == 400
+
+
+def test_rate_limit_sliding_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "_rate_buckets", {})
+    clock = [600.0]  # start of a 60s window
+    monkeypatch.setattr(api, "monotonic", lambda: clock[0])
+    client = TestClient(app)
+    body = {"vin": "1HGCM82633A004352"}
+    for _ in range(api._RATE_LIMIT_MAX):
+        assert client.post("/vin/validate", json=body).status_code == 200
+    assert client.post("/vin/validate", json=body).status_code == 429
+    # Halfway through the next window, half of the previous hits still count.
+    clock[0] = 690.0
+    for _ in range(api._RATE_LIMIT_MAX // 2):
+        assert client.post("/vin/validate", json=body).status_code == 200
+    assert client.post("/vin/validate", json=body).status_code == 429
+    # Two windows later the old hits have aged out entirely.
+    clock[0] = 800.0
+    assert client.post("/vin/validate", json=body).status_code == 200
+
+
+def test_sweep_rate_buckets_drops_idle_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "_rate_buckets", {})
+    clock = [600.0]
+    monkeypatch.setattr(api, "monotonic", lambda: clock[0])
+    client = TestClient(app)
+    client.post("/vin/validate", json={"vin": "1HGCM82633A004352"})
+    assert api._sweep_rate_buckets(now=660.0) == 0  # previous window still counts
+    assert api._sweep_rate_buckets(now=720.0) == 1
+    assert not api._rate_buckets
@@ -22,3 +22,12 @@ def test_stats_endpoint_and_counters() -> None:
     assert "/fib/3" in counters or any(k.startswith("/fib/") for k in counters.keys())
     assert "/health" in counters
 
+
+
+def test_stats_reports_vin_decode_cache() -> None:
+    client = TestClient(app)
+    client.post("/vin/decode", json={"vin": "1HGCM82633A004352"})
+    client.post("/vin/decode", json={"vin": "1hgcm82633a004352"})
+    cache = client.get("/stats").json()["vin_decode_cache"]
+    assert cache["hits"] >= 1
+    assert cache["maxsize"] == 10_000
@@ -42,3 +42,61 @@ def test_sqlite_connector(tmp_path: Path) -> None:
     docs = list(connector.iter_documents())
     assert len(docs) == 2
     assert docs[0].metadata.get("author") in ("Alice", "Bob")
+
+
+def test_to_jsonl_writes_one_document_per_line(tmp_path: Path) -> None:
+    import json
+
+    d = tmp_path / "docs"
+    d.mkdir()
+    for i in range(3):
+        (d / f"{i}.txt").write_text(f"doc {i}, with \"quotes\"\nand newline")
+
+    out = FileSystemConnector(d).to_jsonl(tmp_path / "out" / "docs.jsonl")
+    lines = out.read_text(encoding="utf8").splitlines()
+    assert len(lines) == 3
+    texts = sorted(json.loads(line)["text"] for line in lines)
+    assert texts[0] == 'doc 0, with "quotes"\nand newline'
+
+
+def test_filesystem_connector_recursion_and_extensions(tmp_path: Path) -> None:
+    d = tmp_path / "docs"
+    (d / "nested").mkdir(parents=True)
+    (d / "top.MD").write_text("top")
+    (d / "skip.py").write_text("print()")
+    (d / "nested" / "inner.txt").write_text("inner")
+
+    names = {doc.metadata["name"] for doc in FileSystemConnector(d).iter_documents()}
+    assert names == {"top.MD", "inner.txt"}
+
+    flat = FileSystemConnector(d, recursive=False).iter_documents()
+    assert {doc.metadata["name"] for doc in flat} == {"top.MD"}
+
+
+def test_sqlite_connector_quotes_identifiers(tmp_path: Path) -> None:
+    db = tmp_path / "data.db"
+    conn = sqlite3.connect(db)
+    conn.execute('CREATE TABLE "order" ("id" INTEGER PRIMARY KEY, "group" TEXT, "a""b" TEXT)')
+    conn.execute('INSERT INTO "order" ("group", "a""b") VALUES (?, ?)', ("body", "x"))
+    conn.commit()
+    conn.close()
+
+    connector = SQLiteConnector(db, "order", text_col="group", metadata_cols=['a"b'])
+    docs = list(connector.iter_documents())
+    assert [(d.id, d.text, d.metadata) for d in docs] == [("1", "body", {'a"b': "x"})]
+
+
+def test_sqlite_connector_metadata_keeps_nulls(tmp_path: Path) -> None:
+    db = tmp_path / "data.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, text TEXT, author TEXT, year INT)")
+    conn.execute("INSERT INTO docs (text, author, year) VALUES ('a', 'Ann', 2020)")
+    conn.execute("INSERT INTO docs (text, author, year) VALUES ('b', NULL, 2021)")
+    conn.commit()
+    conn.close()
+
+    docs = list(SQLiteConnector(db, "docs", metadata_cols=["author", "year"]).iter_documents())
+    assert [d.metadata for d in docs] == [
+        {"author": "Ann", "year": "2020"},
+        {"author": None, "year": "2021"},
+    ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from python_mastery_portfolio.doc_qa import NaiveIndex, QAService, SimpleEmbedder
 
 
@@ -24,3 +26,38 @@ def test_qa_service_add_search_reset() -> None:
     qa.reset()
     hits_after = qa.search("VIN", k=5)
     assert hits_after == []
+
+
+def test_faiss_hnsw_index_search_and_reset() -> None:
+    pytest.importorskip("faiss")
+    from python_mastery_portfolio.doc_qa import FaissIndex
+
+    emb = SimpleEmbedder()
+    emb.embed(["cats purr softly", "dogs bark loudly"])  # fix the vocabulary size
+    idx = FaissIndex(emb, hnsw=True)
+    idx.add(["cats purr softly", "dogs bark loudly"])
+    hits = idx.search("cats purr", k=1)
+    assert hits and hits[0][2] == "cats purr softly"
+    idx.reset()
+    assert idx.search("cats", k=1) == []
+
+
+def test_naive_index_caches_query_embeddings_until_add() -> None:
+    emb = SimpleEmbedder()
+    calls: list[list[str]] = []
+    real_embed = emb.embed
+
+    def counting_embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return real_embed(texts)
+
+    emb.embed = counting_embed  # type: ignore[method-assign]
+    idx = NaiveIndex(emb)
+    idx.add(["cats purr softly", "dogs bark loudly"])
+    first = idx.search("cats", k=1)
+    assert idx.search("cats", k=1) == first
+    assert calls.count(["cats"]) == 1
+
+    idx.add(["cats and dogs"])
+    idx.search("cats", k=1)
+    assert calls.count(["cats"]) == 2
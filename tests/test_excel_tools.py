@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import cast
 
@@ -8,7 +9,7 @@ from openpyxl.worksheet.worksheet import Worksheet
 from typer.testing import CliRunner
 
 from python_mastery_portfolio.cli import app
-from python_mastery_portfolio.excel_tools import write_rows_to_excel
+from python_mastery_portfolio.excel_tools import write_rows_to_excel, write_rows_to_excel_stream
 
 
 def test_write_rows_to_excel(tmp_path: Path) -> None:
@@ -22,6 +23,15 @@ def test_write_rows_to_excel(tmp_path: Path) -> None:
     assert ws["B2"].value == "90"
 
 
+def test_write_rows_to_excel_stream() -> None:
+    buf = io.BytesIO()
+    write_rows_to_excel_stream([["Name", "Score"], ["Alice", "90"]], buf)
+    buf.seek(0)
+    ws = cast(Worksheet, load_workbook(buf).active)
+    assert ws["A1"].value == "Name"
+    assert ws["B2"].value == "90"
+
+
 def test_cli_excel_export(tmp_path: Path) -> None:
     runner = CliRunner()
     output = tmp_path / "out.xlsx"
@@ -40,6 +50,19 @@ def test_cli_excel_export(tmp_path: Path) -> None:
     assert Path(result.output.strip()).exists()
 
 
+def test_cli_excel_export_quoted_cells(tmp_path: Path) -> None:
+    runner = CliRunner()
+    output = tmp_path / "quoted.xlsx"
+    result = runner.invoke(
+        app,
+        ["excel-export", "--output", str(output), "Name,Score", '"Doe, Jane",90'],
+    )
+    assert result.exit_code == 0
+    ws = cast(Worksheet, load_workbook(output).active)
+    assert ws["A2"].value == "Doe, Jane"
+    assert ws["B2"].value == "90"
+
+
 def test_write_rows_to_excel_empty(tmp_path: Path) -> None:
     target = tmp_path / "empty.xlsx"
     out = write_rows_to_excel([], target)
@@ -21,6 +21,15 @@ def test_train_and_predict() -> None:
     assert all(abs(a - b) < 1e-6 for a, b in zip(preds, y, strict=True))
 
 
+def test_predict_matches_sklearn_pipeline() -> None:
+    x = [[1.0, 20.0], [2.0, 35.0], [3.0, 41.0], [4.0, 70.0]]
+    y = [5.0, 9.0, 10.0, 16.0]
+    tm = train_linear_regression(x, y, normalize=True)
+    assert tm.scaler is not None
+    expected = tm.model.predict(tm.scaler.transform(x))
+    assert all(abs(a - b) < 1e-9 for a, b in zip(predict(tm, x), expected, strict=True))
+
+
 def test_save_and_load_roundtrip(tmp_path: Path) -> None:
     x = [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
     y = [1.0, 3.0, 5.0]
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import pytest
+
+import python_mastery_portfolio as pkg
+
+
+def test_all_exports_resolve() -> None:
+    for name in pkg.__all__:
+        assert getattr(pkg, name) is not None
+        assert name in dir(pkg)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        pkg.does_not_exist  # noqa: B018
@@ -21,6 +21,12 @@ def test_compute_check_digit_known() -> None:
     assert compute_check_digit(vin) == vin[8]
 
 
+@pytest.mark.parametrize("vin", ["1HGCM8263IA004352", "1HGCM8263\u00e9A004352"])
+def test_compute_check_digit_rejects_invalid_chars(vin: str) -> None:
+    with pytest.raises(KeyError):
+        compute_check_digit(vin)
+
+
 @pytest.mark.parametrize(
     "vin,valid",
     [
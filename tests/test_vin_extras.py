@@ -49,3 +49,15 @@ def test_api_vin_decode_and_generate() -> None:
     assert data["valid"] is True
     assert data["wmi"] == "1HG"
     assert data["model_year"] == 2003
+
+
+def test_api_vin_decode_etag_not_modified() -> None:
+    client = TestClient(app)
+    r = client.post("/vin/decode", json={"vin": "1HGCM82633A004352"})
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+    r2 = client.post(
+        "/vin/decode", json={"vin": "1HGCM82633A004352"}, headers={"If-None-Match": etag}
+    )
+    assert r2.status_code == 304
+    assert r2.headers["ETag"] == etag
@@ -30,3 +30,28 @@ async def _run_smoke_test():
 def test_websocket_manager_smoke():
     asyncio.get_event_loop().run_until_complete(_run_smoke_test())
 
+
+
+class SlowWebSocket(FakeWebSocket):
+    closed = False
+
+    async def send_text(self, message: str):
+        await asyncio.sleep(1)
+
+    async def close(self):
+        self.closed = True
+
+
+async def _run_broadcast_evicts_slow_client():
+    manager = ConnectionManager(send_timeout=0.01)
+    fast, slow = FakeWebSocket(), SlowWebSocket()
+    await manager.connect(fast)
+    await manager.connect(slow)
+    await manager.broadcast("tick")
+    assert fast.sent == ["tick"]
+    assert manager.active_connections == [fast]
+    assert slow.closed
+
+
+def test_broadcast_evicts_slow_client():
+    asyncio.run(_run_broadcast_evicts_slow_client())